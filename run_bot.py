@@ -13,7 +13,7 @@ from dotenv import load_dotenv
 # Ajouter le répertoire racine au PYTHONPATH
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.core.trading_bot import TradingBot
+from src.core.trading_bot import TradingBot, install_event_loop_policy
 from src.core.logger import log_info, log_error
 
 
@@ -77,4 +77,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_event_loop_policy()
     sys.exit(asyncio.run(main()))
\ No newline at end of file
@@ -5,7 +5,7 @@ Script principal pour lancer le bot avec le dashboard web
 
 import asyncio
 import argparse
-from src.core.trading_bot import TradingBot
+from src.core.trading_bot import TradingBot, install_event_loop_policy
 from src.web.modern_dashboard import ModernDashboard
 import uvicorn
 from src.core.logger import log_info, log_error
@@ -62,4 +62,5 @@ async def main():
             await bot.shutdown()
 
 if __name__ == "__main__":
+    install_event_loop_policy()
     asyncio.run(main())
\ No newline at end of file
@@ -11,7 +11,7 @@ import numpy as np
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.core.trading_bot import TradingBot
+from src.core.trading_bot import TradingBot, install_event_loop_policy
 from src.web.modern_dashboard import ModernDashboard
 from src.core.logger import log_info, log_error
 
@@ -62,6 +62,7 @@ async def run_dashboard(bot):
     await server.serve()
 
 if __name__ == "__main__":
+    install_event_loop_policy()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
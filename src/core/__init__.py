@@ -1,6 +1,6 @@
 """Core modules for the trading bot"""
 
-from .trading_bot import TradingBot, BotState
+from .trading_bot import TradingBot, BotState, install_event_loop_policy
 from .weighted_score_engine import WeightedScoreEngine
 from .multi_pair_manager import MultiPairManager
 from .watchlist_scanner import WatchlistScanner
@@ -8,11 +8,12 @@ from .risk_manager import RiskManager
 from .market_data import MarketData
 from .websocket_market_feed import WebSocketMarketFeed, DataType, MarketUpdate, OrderBookSnapshot
 from .adaptive_backtester import AdaptiveBacktester
-from .logger import log_info, log_error, log_warning, log_debug
+from .logger import log_info, log_error, log_warning, log_debug, set_log_level, is_debug_enabled
 
 __all__ = [
     'TradingBot',
     'BotState',
+    'install_event_loop_policy',
     'WeightedScoreEngine',
     'MultiPairManager',
     'WatchlistScanner',
@@ -26,5 +27,7 @@ __all__ = [
     'log_info',
     'log_error',
     'log_warning',
-    'log_debug'
+    'log_debug',
+    'set_log_level',
+    'is_debug_enabled'
 ]
\ No newline at end of file
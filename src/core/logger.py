@@ -43,6 +43,23 @@ if not logger.handlers:
     # Ajout du handler au logger
     logger.addHandler(console_handler)
 
+def set_log_level(level: int | str) -> None:
+    """
+    Change le niveau du logger
+    
+    Args:
+        level: Nom du niveau (ex: 'INFO') ou valeur numérique du module logging
+    """
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+        if not isinstance(level, int):
+            level = logging.INFO
+    logger.setLevel(level)
+
+def is_debug_enabled() -> bool:
+    """Indique si les messages DEBUG sont émis"""
+    return logger.isEnabledFor(logging.DEBUG)
+
 def log_info(message: str, **kwargs):
     """Log un message de niveau INFO"""
     if kwargs:
@@ -55,11 +72,21 @@ def log_error(message: str, **kwargs):
         message = f"{message} | {json.dumps(kwargs)}"
     logger.error(message)
 
-def log_debug(message: str, **kwargs):
-    """Log un message de niveau DEBUG"""
+def log_debug(message: str, *args, **kwargs):
+    """
+    Log un message de niveau DEBUG
+    
+    Les arguments positionnels sont formatés à la %-style par le module
+    logging, uniquement si le niveau DEBUG est actif :
+    log_debug("Stop %s: %.2f", symbol, stop)
+    """
+    # isEnabledFor est mis en cache par le module logging et suit aussi
+    # les appels directs à logger.setLevel()
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     if kwargs:
         message = f"{message} | {json.dumps(kwargs)}"
-    logger.debug(message)
+    logger.debug(message, *args)
 
 def log_warning(message: str, **kwargs):
     """Log un message de niveau WARNING"""
@@ -57,6 +57,14 @@ class MarketData:
         self.ticker_cache_time = {}
         self.ticker_cache_duration = 10  # secondes
         
+        # Tickers temps réel (WebSocket) en colonnes numpy indexées par symbole
+        self.max_symbols = self.config.get('max_symbols', 256)
+        self._sym_idx: Dict[str, int] = {}
+        self.last = np.full(self.max_symbols, np.nan, dtype=np.float64)
+        self.bid = np.full(self.max_symbols, np.nan, dtype=np.float64)
+        self.ask = np.full(self.max_symbols, np.nan, dtype=np.float64)
+        self.ts = np.zeros(self.max_symbols, dtype=np.float64)
+        
         # État du marché global
         self.market_snapshot = None
         self.last_snapshot_time = None
@@ -172,6 +180,76 @@ class MarketData:
         
         return ticker
     
+    @staticmethod
+    def _normalize_symbol(symbol: str) -> str:
+        """Normalise un symbole au format du WebSocket (BTC/USDT -> btcusdt)"""
+        return symbol.replace('/', '').lower()
+    
+    def symbol_index(self, symbol: str) -> int:
+        """
+        Retourne l'index d'un symbole dans les colonnes de tickers
+        
+        Args:
+            symbol: Symbole (BTC/USDT ou btcusdt)
+            
+        Returns:
+            Index du symbole (créé si nécessaire)
+        """
+        key = self._normalize_symbol(symbol)
+        idx = self._sym_idx.get(key)
+        if idx is None:
+            idx = len(self._sym_idx)
+            if idx >= len(self.last):
+                self._grow_ticker_arrays()
+            self._sym_idx[key] = idx
+        return idx
+    
+    def _grow_ticker_arrays(self):
+        """Double la capacité des colonnes de tickers"""
+        size = len(self.last)
+        for name in ('last', 'bid', 'ask'):
+            column = np.full(size * 2, np.nan, dtype=np.float64)
+            column[:size] = getattr(self, name)
+            setattr(self, name, column)
+        ts = np.zeros(size * 2, dtype=np.float64)
+        ts[:size] = self.ts
+        self.ts = ts
+    
+    def update_ticker(self, symbol: str, data: Dict, timestamp: float):
+        """
+        Met à jour le ticker temps réel d'un symbole
+        
+        Args:
+            symbol: Symbole
+            data: Ticker reçu du WebSocket (last, bid, ask)
+            timestamp: Timestamp de réception
+        """
+        # Les symboles du WebSocket sont déjà normalisés (btcusdt) : essayer
+        # la clé brute avant de normaliser
+        i = self._sym_idx.get(symbol)
+        if i is None:
+            i = self.symbol_index(symbol)
+        self.last[i] = data['last']
+        self.bid[i] = data['bid']
+        self.ask[i] = data['ask']
+        self.ts[i] = timestamp
+    
+    def get_last_price(self, symbol: str) -> Optional[float]:
+        """
+        Récupère le dernier prix temps réel d'un symbole
+        
+        Args:
+            symbol: Symbole
+            
+        Returns:
+            Dernier prix ou None si aucun ticker reçu
+        """
+        idx = self._sym_idx.get(self._normalize_symbol(symbol))
+        if idx is None:
+            return None
+        price = self.last[idx]
+        return None if np.isnan(price) else float(price)
+    
     def calculate_indicators(self, symbol: str, timeframe: str = None) -> Dict:
         """
         Calcule les indicateurs techniques
@@ -5,10 +5,12 @@ Coordonne les stratégies sur plusieurs paires simultanément
 
 import asyncio
 import sys
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from collections import defaultdict
+import numpy as np
 
 # Ajouter le répertoire racine au PYTHONPATH
 root_dir = Path(__file__).parent.parent.parent
@@ -61,6 +63,11 @@ class MultiPairManager:
             'last_trade': None
         })
         
+        # PnL cumulé et date du dernier trade (ns) par paire, en colonnes numpy
+        self._perf_idx: Dict[str, int] = {}
+        self.perf_pnl = np.zeros(16, dtype=np.float64)
+        self.perf_last_trade_ns = np.zeros(16, dtype=np.int64)
+        
         # Capital disponible
         self.available_capital = 10000.0  # USDT
         self.capital_per_pair = 2000.0    # Max par paire
@@ -258,6 +265,8 @@ class MultiPairManager:
             else:
                 perf['losses'] = (perf['losses'] or 0) + 1
             
+            self._record_trade_performance(symbol, perf['pnl'])
+            
             # Logger le trade
             log_trade(
                 action='SELL',
@@ -283,6 +292,28 @@ class MultiPairManager:
             self.strategies[symbol].current_position = None
             self.strategies[symbol].entry_price = None
     
+    def _record_trade_performance(self, symbol: str, pnl: float):
+        """
+        Reporte le PnL cumulé d'une paire dans les colonnes de performance
+        
+        Args:
+            symbol: Symbole de la paire
+            pnl: PnL cumulé de la paire
+        """
+        i = self._perf_idx.get(symbol)
+        if i is None:
+            i = len(self._perf_idx)
+            if i >= len(self.perf_pnl):
+                size = len(self.perf_pnl)
+                self.perf_pnl = np.concatenate([self.perf_pnl, np.zeros(size, dtype=np.float64)])
+                self.perf_last_trade_ns = np.concatenate(
+                    [self.perf_last_trade_ns, np.zeros(size, dtype=np.int64)]
+                )
+            self._perf_idx[symbol] = i
+        
+        self.perf_pnl[i] = pnl
+        self.perf_last_trade_ns[i] = time.time_ns()
+    
     def get_performance_summary(self) -> dict:
         """Retourne un résumé des performances"""
         total_trades = sum(p['trades'] for p in self.performance.values())
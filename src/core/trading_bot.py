@@ -4,23 +4,39 @@ Version améliorée avec WebSocket et gestion robuste
 """
 
 import asyncio
-import json
+import collections
+import heapq
 import signal
 import sys
-from typing import Dict, List, Optional, Set, cast
-from datetime import datetime, timedelta
+from typing import Callable, Coroutine, Deque, Dict, List, Optional, Set, Tuple, cast
+from datetime import datetime
 from pathlib import Path
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
 import os
+import time
 import traceback
+import numpy as np
+import orjson
 import pandas as pd
 
+# Boucle d'événements optionnelle (libuv, non disponible sous Windows)
+try:
+    import uvloop  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    uvloop = None
+
+# Publication de l'état via Redis (optionnelle)
+try:
+    import redis.asyncio as aioredis  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    aioredis = None
+
 # Ajouter le répertoire racine au PYTHONPATH
 root_dir = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(root_dir))
 
-from src.core.logger import log_info, log_error, log_debug, log_warning, log_trade
+from src.core.logger import log_info, log_error, log_debug, log_warning, log_trade, set_log_level
 from src.core.multi_pair_manager import MultiPairManager
 from src.core.watchlist_scanner import WatchlistScanner
 from src.core.weighted_score_engine import WeightedScoreEngine
@@ -34,17 +50,37 @@ from src.core.adaptive_backtester import AdaptiveBacktester
 from config.settings import load_config, validate_config
 
 
-class BotState(Enum):
-    """États possibles du bot"""
-    INITIALIZING = "initializing"
-    RUNNING = "running"
-    PAUSED = "paused"
-    STOPPING = "stopping"
-    STOPPED = "stopped"
-    ERROR = "error"
+def install_event_loop_policy() -> bool:
+    """
+    Installe uvloop comme boucle d'événements si disponible
+    
+    Doit être appelé avant la création de la boucle (avant asyncio.run).
+    Sans uvloop (ex: Windows), la boucle asyncio native est conservée.
+    
+    Returns:
+        True si uvloop est utilisé
+    """
+    if uvloop is None:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+class BotState(IntEnum):
+    """États possibles du bot (sérialisés via name.lower())"""
+    INITIALIZING = 0
+    RUNNING = 1
+    PAUSED = 2
+    STOPPING = 3
+    STOPPED = 4
+    ERROR = 5
+
+
+# __slots__ générés par dataclass (Python 3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class BotStatus:
     """Status complet du bot"""
     state: BotState
@@ -54,7 +90,7 @@ class BotStatus:
     open_positions: int = 0
     total_pnl: float = 0.0
     daily_pnl: float = 0.0
-    errors: List[str] = field(default_factory=list)
+    errors: Deque[str] = field(default_factory=lambda: collections.deque(maxlen=100))
     metrics: Dict = field(default_factory=dict)
 
 
@@ -74,12 +110,18 @@ class TradingBot:
         self.paper_trading = paper_trading
         
         # État du bot
+        now = datetime.now()
         self.status = BotStatus(
             state=BotState.INITIALIZING,
-            start_time=datetime.now(),
-            last_update=datetime.now()
+            start_time=now,
+            last_update=now
         )
         
+        # Horodatage monotone de la dernière mise à jour, converti en datetime
+        # uniquement pour l'affichage (get_status)
+        self._last_update_ns = time.monotonic_ns()
+        self._wall_clock_offset_ns = time.time_ns() - self._last_update_ns
+        
         # Composants principaux
         self.exchange: Optional[ExchangeConnector] = None
         self.websocket_feed: Optional[WebSocketMarketFeed] = None
@@ -90,12 +132,30 @@ class TradingBot:
         self.notifier: Optional[TelegramNotifier] = None
         self.backtester: Optional[AdaptiveBacktester] = None
         self.optimization_task: Optional[asyncio.Task] = None
+        self._redis = None
         
         # Contrôle d'exécution
         self._main_task: Optional[asyncio.Task] = None
         self._shutdown_event = asyncio.Event()
         self._tasks: Set[asyncio.Task] = set()
         self._force_shutdown = False
+        # Délai avant nouvel essai d'une tâche périodique en erreur (secondes)
+        self._scheduler_retry_delay = 5
+        # Vrai tant que le bot tourne et trade (lu par les boucles)
+        self._running = False
+        
+        # File des mises à jour WebSocket (consommée par lots)
+        self._update_queue: asyncio.Queue = asyncio.Queue(maxsize=10000)
+        self._update_batch_size = 256
+        
+        # Compteurs du chemin WebSocket (reportés dans status.metrics par get_status)
+        self._ws_update_count = 0
+        # Latence max et nombre d'updates > 200ms depuis le dernier health check
+        self._ws_latency_max = 0.0
+        self._ws_latency_over = 0
+        
+        # Méthodes du chemin chaud liées après initialize()
+        self._update_ticker: Optional[Callable] = None
         
         # Gestion des signaux système
         self._setup_signal_handlers()
@@ -117,6 +177,9 @@ class TradingBot:
             if not validate_config(config):
                 raise ValueError("Configuration invalide")
             
+            # Appliquer le niveau de log configuré
+            set_log_level(config.get('logging', {}).get('level', 'INFO'))
+            
             return config
             
         except Exception as e:
@@ -124,16 +187,43 @@ class TradingBot:
             log_error(f"Erreur lors du chargement de la config: {str(e)}\nTraceback:\n{tb}")
             raise
     
+    def _on_shutdown_signal(self):
+        """Demande l'arrêt du bot suite à un signal système"""
+        log_info("🛑 Signal d'arrêt reçu, fermeture en cours...")
+        self._force_shutdown = True
+        self._shutdown_event.set()
+    
     def _setup_signal_handlers(self):
-        """Configure les gestionnaires de signaux système"""
+        """
+        Configure les gestionnaires de signaux système
+        
+        Sous Windows la boucle asyncio ne supporte pas add_signal_handler :
+        on garde signal.signal. Ailleurs les gestionnaires sont installés
+        sur la boucle au démarrage (voir _install_loop_signal_handlers).
+        """
+        if sys.platform != "win32":
+            return
         def signal_handler(sig, frame):
-            log_info("🛑 Signal d'arrêt reçu, fermeture en cours...")
-            self._force_shutdown = True
-            self._shutdown_event.set()
+            self._on_shutdown_signal()
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
+        signal.signal(signal.SIGBREAK, signal_handler)
+    
+    def _install_loop_signal_handlers(self):
+        """Installe SIGINT/SIGTERM sur la boucle d'événements courante"""
         if sys.platform == "win32":
-            signal.signal(signal.SIGBREAK, signal_handler)
+            return
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self._on_shutdown_signal)
+    
+    def _remove_loop_signal_handlers(self):
+        """Retire les gestionnaires de signaux installés sur la boucle"""
+        if sys.platform == "win32":
+            return
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.remove_signal_handler(sig)
     
     async def initialize(self) -> bool:
         """
@@ -217,6 +307,9 @@ class TradingBot:
                 initial_capital=self.config['trading']['initial_balance']
             )
             
+            # 9. Publication de l'état sur Redis (si configurée)
+            await self._connect_redis()
+            
             # Initialiser les données de marché
             initial_pairs = self.config['trading']['pairs']
             await self.market_data.initialize(initial_pairs)
@@ -228,6 +321,8 @@ class TradingBot:
                 log_error(f"Erreur lors de la configuration des abonnements WebSocket: {str(e)}")
                 raise
             
+            self._bind_hot_paths()
+            
             self.status.state = BotState.STOPPED
             log_info("✅ Tous les composants initialisés avec succès")
             
@@ -240,6 +335,33 @@ class TradingBot:
             self.status.errors.append(str(e))
             return False
     
+    async def _connect_redis(self):
+        """Connecte le client Redis de publication d'état si redis_url est configuré"""
+        redis_url = self.config.get('redis_url')
+        if not redis_url:
+            return
+        
+        if aioredis is None:
+            log_warning("redis_url configuré mais le paquet redis n'est pas installé, état sauvegardé sur disque")
+            return
+        
+        client = None
+        try:
+            client = aioredis.from_url(redis_url)
+            await client.ping()
+        except Exception as e:
+            log_error(f"Connexion Redis impossible, état sauvegardé sur disque: {str(e)}")
+            # Ne pas laisser le pool de connexions ouvert
+            if client is not None:
+                try:
+                    await client.aclose()
+                except Exception:
+                    pass
+            return
+        
+        self._redis = client
+        log_info("✅ Publication de l'état sur Redis activée")
+    
     async def _setup_websocket_subscriptions(self, symbols: List[str]):
         """Configure les abonnements WebSocket"""
         log_info(f"Configuration des abonnements WebSocket pour {len(symbols)} paires")
@@ -247,46 +369,110 @@ class TradingBot:
         if not self.websocket_feed:
             raise Exception("WebSocket feed non initialisé")
             
-        for symbol in symbols:
-            try:
-                log_info(f"Abonnement à {symbol}")
-                # S'abonner aux données nécessaires
-                self.websocket_feed.subscribe(
-                    symbol=symbol,
-                    data_types=[DataType.TICKER, DataType.TRADES, DataType.ORDERBOOK],
-                    callback=self._handle_market_update
-                )
-                log_info(f"✅ Abonnement réussi pour {symbol}")
-            except Exception as e:
-                log_error(f"Erreur lors de l'abonnement à {symbol}: {str(e)}")
-                raise
+        try:
+            # Une seule commande SUBSCRIBE pour toutes les paires
+            await self.websocket_feed.subscribe_many(
+                symbols,
+                [DataType.TICKER, DataType.TRADES, DataType.ORDERBOOK],
+                callback=self._handle_market_update
+            )
+        except Exception as e:
+            log_error(f"Erreur lors de l'abonnement aux paires: {str(e)}")
+            raise
         
         log_info(f"✅ Abonné aux flux WebSocket pour {len(symbols)} paires")
     
-    async def _handle_market_update(self, update: MarketUpdate):
+    def _handle_market_update(self, update: MarketUpdate):
         """
-        Traite les mises à jour du marché en temps réel
+        Reçoit les mises à jour du marché en temps réel
+        
+        Appelé par le WebSocket pour chaque tick : la mise à jour est
+        seulement mise en file, le traitement est fait par lots dans
+        _update_consumer_loop.
         
         Args:
             update: Mise à jour reçue du WebSocket
         """
         try:
-            # Mettre à jour les données en cache
-            if update.data_type == DataType.TICKER:
-                # Mise à jour rapide du ticker
-                if self.market_data and hasattr(self.market_data, 'ticker_cache'):
-                    self.market_data.ticker_cache[update.symbol] = update.data
-                
-            elif update.data_type == DataType.ORDERBOOK:
-                # Mise à jour du carnet d'ordres
-                # Note: _update_orderbook n'existe pas dans MarketData, on skip pour l'instant
+            self._update_queue.put_nowait(update)
+        except asyncio.QueueFull:
+            # Abandonner la plus ancienne mise à jour
+            try:
+                self._update_queue.get_nowait()
+            except asyncio.QueueEmpty:
                 pass
-            
-            # Incrémenter les métriques
-            self.status.metrics['ws_updates'] = self.status.metrics.get('ws_updates', 0) + 1
-            
-        except Exception as e:
-            log_error(f"Erreur traitement update {update.symbol}: {str(e)}")
+            self._update_queue.put_nowait(update)
+    
+    def _bind_hot_paths(self):
+        """Lie les méthodes appelées à chaque update WebSocket (évite les chaînes d'attributs)"""
+        self._update_ticker = self.market_data.update_ticker if self.market_data else None
+    
+    def _apply_batch(self, batch: List[MarketUpdate]):
+        """
+        Applique un lot de mises à jour du marché aux caches
+        
+        Les attributs utilisés pour chaque update sont liés à des variables
+        locales une seule fois par lot.
+        
+        Args:
+            batch: Mises à jour reçues du WebSocket
+        """
+        update_ticker = self._update_ticker
+        if update_ticker is None and self.market_data:
+            update_ticker = self._update_ticker = self.market_data.update_ticker
+        TICKER = DataType.TICKER
+        latency_max = self._ws_latency_max
+        latency_over = 0
+        applied = 0
+        
+        for update in batch:
+            try:
+                # Mise à jour rapide du ticker (les carnets d'ordres ne sont
+                # pas stockés par MarketData)
+                if update.data_type is TICKER and update_ticker is not None:
+                    update_ticker(update.symbol, update.data, update.timestamp)
+                
+                latency = update.latency_ms
+                if latency > latency_max:
+                    latency_max = latency
+                latency_over += latency > 200
+                applied += 1
+                
+            except Exception as e:
+                log_error(f"Erreur traitement update {update.symbol}: {str(e)}")
+        
+        # Reporter les métriques une fois par lot
+        self._ws_update_count += applied
+        self._ws_latency_max = latency_max
+        self._ws_latency_over += latency_over
+    
+    async def _update_consumer_loop(self):
+        """Boucle de traitement par lots des mises à jour WebSocket"""
+        queue = self._update_queue
+        while not self._shutdown_event.is_set():
+            try:
+                if queue.empty():
+                    # File vide : attente bornée pour voir l'arrêt sur un flux calme
+                    try:
+                        batch = [await asyncio.wait_for(queue.get(), timeout=1.0)]
+                    except asyncio.TimeoutError:
+                        continue
+                else:
+                    batch = [queue.get_nowait()]
+                while len(batch) < self._update_batch_size and not queue.empty():
+                    batch.append(queue.get_nowait())
+                
+                self._apply_batch(batch)
+                
+                # Rendre la main à la boucle entre deux lots
+                await asyncio.sleep(0)
+                
+            except asyncio.CancelledError:
+                log_debug("Update consumer loop annulée")
+                break
+            except Exception as e:
+                log_error(f"Erreur dans update consumer: {str(e)}")
+                await asyncio.sleep(1)
     
     async def _get_historical_data(self, symbol: str, days: int) -> pd.DataFrame:
         """Récupère les données historiques pour un symbole"""
@@ -317,7 +503,7 @@ class TradingBot:
         """Boucle d'optimisation automatique"""
         while not self._shutdown_event.is_set():
             try:
-                if self.status.state != BotState.RUNNING:
+                if not self._running:
                     await asyncio.sleep(1)
                     continue
                 log_info("🔧 Début du cycle d'optimisation")
@@ -375,14 +561,23 @@ class TradingBot:
     async def start(self):
         """Démarre le bot de trading"""
         if self.status.state not in [BotState.STOPPED, BotState.ERROR]:
-            log_warning(f"Impossible de démarrer, état actuel: {self.status.state}")
+            log_warning(f"Impossible de démarrer, état actuel: {self.status.state.name.lower()}")
             return
         
         log_info("🚀 Démarrage du bot de trading...")
         self.status.state = BotState.RUNNING
+        self._running = True
         self.status.start_time = datetime.now()
         
         try:
+            # Exécution immédiate des coroutines jusqu'à leur première vraie
+            # suspension (Python 3.12+)
+            if hasattr(asyncio, 'eager_task_factory'):
+                asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+            # Signaux traités dans le thread de la boucle
+            self._install_loop_signal_handlers()
+            
             # Créer la tâche principale
             self._main_task = asyncio.create_task(self._main_loop())
             log_info("Tâche principale créée")
@@ -401,19 +596,68 @@ class TradingBot:
             # Nettoyer les ressources
             await self.shutdown()
     
+    def _get_periodic_jobs(self) -> List[Tuple[str, float, Callable[[], Coroutine]]]:
+        """
+        Retourne les tâches périodiques activées dans la configuration
+        
+        Chaque tâche peut être désactivée via la section 'loops' de la
+        configuration (ex: {"loops": {"scanner": false}}).
+        
+        Returns:
+            Liste de (nom, intervalle en secondes, fonction d'itération)
+        """
+        loops_config = self.config.get('loops', {})
+        jobs = [
+            ('scanner', "Scanner", self.config.get('scanner_interval', 300), self._market_scanner_tick),
+            ('strategy', "Strategy", self.config.get('strategy_interval', 60), self._strategy_tick),
+            ('risk_monitor', "Risk Monitor", 30, self._risk_monitor_tick),
+            ('performance', "Performance", 300, self._performance_tracker_tick),
+            ('health_check', "Health Check", 60, self._health_check_tick)
+        ]
+        return [(name, interval, tick) for key, name, interval, tick in jobs if loops_config.get(key, True)]
+    
+    def _get_enabled_loops(self) -> List[Tuple[str, Callable[[], Coroutine]]]:
+        """
+        Retourne les boucles de fond activées dans la configuration
+        
+        Le consommateur des mises à jour WebSocket est toujours actif : les
+        prix temps réel (trailing stops, fraîcheur des paires) en dépendent.
+        
+        Returns:
+            Liste de (nom de la tâche, fabrique de coroutine)
+        """
+        loops_config = self.config.get('loops', {})
+        loops = []
+        if self._get_periodic_jobs():
+            loops.append(("Scheduler", self._scheduler_loop))
+        if loops_config.get('optimizer', True):
+            loops.append(("Optimizer", self._optimization_loop))
+        loops.append(("Updates", self._update_consumer_loop))
+        return loops
+    
     async def _main_loop(self):
         """Boucle principale du bot"""
         log_info("Boucle principale démarrée")
         
+        loops = self._get_enabled_loops()
+        if not loops:
+            log_warning("Aucune tâche activée dans la configuration")
+            await self._shutdown_event.wait()
+            return
+        
+        # Une seule tâche : l'exécuter directement, sans tâche ni supervision
+        if len(loops) == 1:
+            name, factory = loops[0]
+            log_info(f"Tâche unique {name}, exécution directe")
+            try:
+                await factory()
+            finally:
+                log_info("Boucle principale terminée")
+            return
+        
         # Créer les tâches parallèles
-        tasks = [
-            self._create_monitored_task(self._market_scanner_task(), "Scanner"),
-            self._create_monitored_task(self._strategy_loop(), "Strategy"),
-            self._create_monitored_task(self._risk_monitor_loop(), "Risk Monitor"),
-            self._create_monitored_task(self._performance_tracker_loop(), "Performance"),
-            self._create_monitored_task(self._health_check_loop(), "Health Check"),
-            self._create_monitored_task(self._optimization_loop(), "Optimizer")  # Ajout de l'optimizer
-        ]
+        factories = dict(loops)
+        tasks = [self._create_monitored_task(factory(), name) for name, factory in loops]
         
         log_info(f"✅ {len(tasks)} tâches principales créées")
         
@@ -427,18 +671,7 @@ class TradingBot:
                             log_error(f"Tâche {i} terminée avec erreur: {task.exception()}")
                             # Recréer la tâche
                             task_name = task.get_name()
-                            if "Scanner" in task_name:
-                                tasks[i] = self._create_monitored_task(self._market_scanner_task(), "Scanner")
-                            elif "Strategy" in task_name:
-                                tasks[i] = self._create_monitored_task(self._strategy_loop(), "Strategy")
-                            elif "Risk Monitor" in task_name:
-                                tasks[i] = self._create_monitored_task(self._risk_monitor_loop(), "Risk Monitor")
-                            elif "Performance" in task_name:
-                                tasks[i] = self._create_monitored_task(self._performance_tracker_loop(), "Performance")
-                            elif "Health Check" in task_name:
-                                tasks[i] = self._create_monitored_task(self._health_check_loop(), "Health Check")
-                            elif "Optimizer" in task_name:
-                                tasks[i] = self._create_monitored_task(self._optimization_loop(), "Optimizer")
+                            tasks[i] = self._create_monitored_task(factories[task_name](), task_name)
                 
                 # Attendre un court instant
                 await asyncio.sleep(1)
@@ -479,236 +712,245 @@ class TradingBot:
         task.add_done_callback(lambda t: self._tasks.discard(t))
         return task
     
-    async def _market_scanner_task(self):
-        """Tâche de scan du marché"""
-        scan_interval = self.config.get('scanner_interval', 300)
-        while not self._shutdown_event.is_set():
-            try:
-                if self.status.state != BotState.RUNNING:
-                    await asyncio.sleep(1)
-                    continue
-                log_debug("Scan du marché en cours...")
-                
-                # Mettre à jour la watchlist
-                if self.watchlist_scanner:
-                    await self.watchlist_scanner.update_watchlist()
-                
-                # Mettre à jour les données de marché
-                if self.market_data and hasattr(self.market_data, 'update_all'):
-                    await self.market_data.update_all()
-                
-                # Attendre avant le prochain scan
-                try:
-                    await asyncio.wait_for(
-                        self._shutdown_event.wait(),
-                        timeout=scan_interval
-                    )
-                    break
-                except asyncio.TimeoutError:
-                    pass
-                
-            except asyncio.CancelledError:
-                log_debug("Market scanner loop annulée")
-                break
-            except Exception as e:
-                log_error(f"Erreur dans market scanner: {str(e)}")
-                await asyncio.sleep(5)
-    
-    async def _strategy_loop(self):
-        """Boucle d'exécution des stratégies"""
-        interval = self.config.get('strategy_interval', 60)
-        while not self._shutdown_event.is_set():
-            try:
-                if self.status.state != BotState.RUNNING:
-                    await asyncio.sleep(1)
-                    continue
-                log_debug("Exécution de la boucle de stratégie...")
-                
-                # Vérifier que tous les composants sont prêts
-                if not all([self.pair_manager, self.market_data, self.websocket_feed]):
-                    log_warning("Composants non initialisés, attente...")
-                    await asyncio.sleep(5)
-                    continue
-                
-                # Mettre à jour les données
-                try:
-                    if self.pair_manager is not None:
-                        await self.pair_manager.update_market_data()
-                        log_debug("Données de marché mises à jour")
-                except Exception as e:
-                    log_error(f"Erreur mise à jour données: {str(e)}")
-                    await asyncio.sleep(10)
-                    continue
-                
-                # Vérifier les signaux
+    async def _scheduler_loop(self):
+        """
+        Ordonnanceur unique des tâches périodiques
+        
+        Les échéances sont gardées dans un tas : une seule coroutine attend la
+        prochaine échéance puis lance la tâche correspondante dans son propre
+        asyncio.Task, pour qu'une itération lente (scan, REST, reconnexion)
+        ne retarde pas les autres (surveillance des risques).
+        
+        Une tâche n'est replanifiée qu'à la fin de son exécution : au plus une
+        exécution par tâche est en cours, elles ne se chevauchent jamais.
+        """
+        now = time.monotonic_ns()
+        jobs = [(now, int(interval * 1e9), name, tick) for name, interval, tick in self._get_periodic_jobs()]
+        if not jobs:
+            return
+        heapq.heapify(jobs)
+        
+        running: Dict[str, asyncio.Task] = {}
+        wakeup = asyncio.Event()
+        
+        def on_tick_done(task: asyncio.Task, interval: int, name: str, tick: Callable):
+            running.pop(name, None)
+            if task.cancelled():
+                return
+            # Replanifier : intervalle normal ou délai de reprise demandé
+            retry_after = task.result()
+            delay = interval if retry_after is None else int(retry_after * 1e9)
+            heapq.heappush(jobs, (time.monotonic_ns() + delay, interval, name, tick))
+            wakeup.set()
+        
+        # Réveiller l'ordonnanceur à l'arrêt
+        shutdown_waiter = asyncio.create_task(self._shutdown_event.wait())
+        shutdown_waiter.add_done_callback(lambda _: wakeup.set())
+        
+        try:
+            while not self._shutdown_event.is_set():
                 try:
-                    signals = {}
-                    if self.pair_manager is not None:
-                        signals = await self.pair_manager.check_signals()
+                    if not self._running:
+                        await asyncio.sleep(1)
+                        continue
                     
-                    if signals:
-                        log_info(f"📊 {len(signals)} signaux détectés")
-                        # Exécuter les signaux
-                        if self.pair_manager is not None:
-                            await self.pair_manager.execute_signals(signals)
-                        
-                        # Notifier via Telegram
-                        if self.notifier:
-                            for symbol, signal_data in signals.items():
-                                await self.notifier.notify_trade({
-                                    'symbol': symbol,
-                                    'side': signal_data['signal'],
-                                    'price': signal_data['indicators']['current_price'],
-                                    'quantity': 0.001,  # À calculer
-                                    'confidence': signal_data.get('confidence', 0),
-                                    'reason': signal_data.get('reason', '')
-                                })
-                except Exception as e:
-                    log_error(f"Erreur vérification signaux: {str(e)}")
-                    await asyncio.sleep(10)
-                    continue
-                
-                # Mettre à jour les métriques
-                if self.pair_manager and hasattr(self.pair_manager, 'positions'):
-                    self.status.open_positions = len(self.pair_manager.positions)
-                self.status.last_update = datetime.now()
-                
-                # Sauvegarder l'état
-                if self.config.get('save_state', True):
-                    await self._save_state()
-                    log_debug("État du bot sauvegardé")
-                
-                # Attendre avant la prochaine itération
-                try:
-                    await asyncio.wait_for(
-                        self._shutdown_event.wait(),
-                        timeout=interval
-                    )
-                    break
-                except asyncio.TimeoutError:
-                    pass
-                
-            except asyncio.CancelledError:
-                log_debug("Stratégie loop annulée")
-                break
-            except Exception as e:
-                log_error(f"Erreur dans strategy loop: {str(e)}")
-                await asyncio.sleep(5)
-    
-    async def _risk_monitor_loop(self):
-        """Boucle de surveillance des risques"""
-        interval = 30
-        while not self._shutdown_event.is_set():
-            try:
-                if self.status.state != BotState.RUNNING:
-                    await asyncio.sleep(1)
-                    continue
-                if not self.risk_manager:
-                    await asyncio.sleep(interval)
-                    continue
+                    wakeup.clear()
+                    if not jobs:
+                        # Toutes les tâches sont en cours d'exécution
+                        await wakeup.wait()
+                        continue
                     
-                # Récupérer les métriques de risque
-                capital = self.config['trading']['initial_balance']
-                risk_metrics = self.risk_manager.get_risk_metrics(capital)
-                
-                # Vérifier les limites
-                if risk_metrics.current_drawdown > 0.15:  # 15% drawdown
-                    log_warning(f"⚠️ Drawdown élevé: {risk_metrics.current_drawdown:.1%}")
+                    deadline, interval, name, tick = jobs[0]
+                    now = time.monotonic_ns()
+                    if deadline > now:
+                        # Attendre la prochaine échéance, une replanification ou l'arrêt
+                        try:
+                            await asyncio.wait_for(wakeup.wait(), timeout=(deadline - now) / 1e9)
+                        except asyncio.TimeoutError:
+                            pass
+                        continue
                     
-                    if risk_metrics.current_drawdown > 0.20:  # 20% = limite critique
-                        log_error("🚨 DRAWDOWN CRITIQUE - Arrêt du trading")
-                        await self._pause_trading()
-                        
-                        if self.notifier:
-                            await self.notifier.send_message(
-                                "🚨 ALERTE CRITIQUE: Drawdown > 20% - Trading mis en pause",
-                                NotificationLevel.ALERT
-                            )
-                
-                if risk_metrics.daily_pnl < -0.05:  # Perte quotidienne > 5%
-                    log_warning(f"⚠️ Perte quotidienne élevée: {risk_metrics.daily_pnl:.1%}")
-                
-                # Mettre à jour les positions avec trailing stops
-                if self.pair_manager and self.websocket_feed and hasattr(self.pair_manager, 'positions'):
-                    for symbol, position in self.pair_manager.positions.items():
-                        ticker = self.websocket_feed.get_ticker(symbol)
-                        if ticker:
-                            new_stop = self.risk_manager.update_trailing_stop(
-                                position, ticker['last']
-                            )
-                            if new_stop:
-                                position['stop_loss'] = new_stop
-                                log_debug(f"Trailing stop mis à jour pour {symbol}: {new_stop:.2f}")
-                
-                try:
-                    await asyncio.wait_for(
-                        self._shutdown_event.wait(),
-                        timeout=interval
+                    heapq.heappop(jobs)
+                    task = asyncio.create_task(self._run_scheduled_tick(name, tick), name=f"Scheduler {name}")
+                    running[name] = task
+                    task.add_done_callback(
+                        lambda t, interval=interval, name=name, tick=tick: on_tick_done(t, interval, name, tick)
                     )
+                    
+                except asyncio.CancelledError:
+                    log_debug("Scheduler loop annulée")
                     break
-                except asyncio.TimeoutError:
-                    pass
-                
-            except asyncio.CancelledError:
-                log_debug("Risk monitor loop annulée")
-                break
-            except Exception as e:
-                log_error(f"Erreur dans risk monitor: {str(e)}")
-                await asyncio.sleep(5)
+                except Exception as e:
+                    log_error(f"Erreur dans scheduler: {str(e)}")
+                    await asyncio.sleep(5)
+        finally:
+            # Arrêter les itérations encore en cours
+            shutdown_waiter.cancel()
+            pending = list(running.values())
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(shutdown_waiter, *pending, return_exceptions=True)
     
-    async def _performance_tracker_loop(self):
-        """Boucle de suivi des performances"""
-        interval = 300
-        while not self._shutdown_event.is_set():
-            try:
-                if self.status.state != BotState.RUNNING:
-                    await asyncio.sleep(1)
-                    continue
-                if not self.pair_manager:
-                    await asyncio.sleep(interval)
-                    continue
-                    
-                # Calculer les performances
-                perf = {}
-                if hasattr(self.pair_manager, 'get_performance_summary'):
-                    perf = self.pair_manager.get_performance_summary()
-                
-                # Mettre à jour le status
-                self.status.total_trades = perf.get('total_trades', 0)
-                self.status.total_pnl = perf.get('total_pnl', 0.0)
-                
-                # Calculer le PnL quotidien
-                daily_pnl = self._calculate_daily_pnl()
-                self.status.daily_pnl = daily_pnl
-                
-                # Logger les performances
-                if perf.get('total_trades', 0) > 0:
-                    log_info(
-                        f"📈 Performance - Trades: {perf['total_trades']} | "
-                        f"Win Rate: {perf.get('win_rate', 0):.1f}% | "
-                        f"PnL: {perf.get('total_pnl', 0):+.2f} USDT | "
-                        f"Daily: {daily_pnl:+.2f} USDT"
-                    )
+    async def _run_scheduled_tick(self, name: str, tick: Callable[[], Coroutine]) -> Optional[float]:
+        """
+        Exécute une itération d'une tâche périodique
+        
+        Args:
+            name: Nom de la tâche
+            tick: Fonction d'itération
+            
+        Returns:
+            Délai avant la prochaine exécution (None pour l'intervalle normal)
+        """
+        try:
+            return await tick()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log_error(f"Erreur dans tâche {name}: {str(e)}")
+            return self._scheduler_retry_delay
+    
+    async def _market_scanner_tick(self):
+        """Scan du marché"""
+        log_debug("Scan du marché en cours...")
+        
+        # Mettre à jour la watchlist
+        if self.watchlist_scanner:
+            await self.watchlist_scanner.update_watchlist()
+        
+        # Mettre à jour les données de marché
+        if self.market_data and hasattr(self.market_data, 'update_all'):
+            await self.market_data.update_all()
+    
+    async def _strategy_tick(self) -> Optional[float]:
+        """
+        Exécution des stratégies
+        
+        Returns:
+            Délai avant nouvel essai en cas d'échec, None sinon
+        """
+        log_debug("Exécution de la boucle de stratégie...")
+        
+        # Vérifier que tous les composants sont prêts
+        if not all([self.pair_manager, self.market_data, self.websocket_feed]):
+            log_warning("Composants non initialisés, attente...")
+            return 5
+        
+        # Mettre à jour les données
+        try:
+            if self.pair_manager is not None:
+                await self.pair_manager.update_market_data()
+                log_debug("Données de marché mises à jour")
+        except Exception as e:
+            log_error(f"Erreur mise à jour données: {str(e)}")
+            return 10
+        
+        # Vérifier les signaux
+        try:
+            signals = {}
+            if self.pair_manager is not None:
+                signals = await self.pair_manager.check_signals()
+            
+            if signals:
+                log_info(f"📊 {len(signals)} signaux détectés")
+                # Exécuter les signaux
+                if self.pair_manager is not None:
+                    await self.pair_manager.execute_signals(signals)
                 
-                # Envoyer résumé quotidien si c'est l'heure
-                if self.notifier and datetime.now().hour == 18 and datetime.now().minute < 5:
-                    await self._send_daily_summary()
+                # Notifier via Telegram
+                if self.notifier:
+                    for symbol, signal_data in signals.items():
+                        await self.notifier.notify_trade({
+                            'symbol': symbol,
+                            'side': signal_data['signal'],
+                            'price': signal_data['indicators']['current_price'],
+                            'quantity': 0.001,  # À calculer
+                            'confidence': signal_data.get('confidence', 0),
+                            'reason': signal_data.get('reason', '')
+                        })
+        except Exception as e:
+            log_error(f"Erreur vérification signaux: {str(e)}")
+            return 10
+        
+        # Mettre à jour les métriques
+        if self.pair_manager and hasattr(self.pair_manager, 'positions'):
+            self.status.open_positions = len(self.pair_manager.positions)
+        self._last_update_ns = time.monotonic_ns()
+        
+        # Sauvegarder l'état
+        if self.config.get('save_state', True):
+            await self._save_state()
+            log_debug("État du bot sauvegardé")
+        
+        return None
+    
+    async def _risk_monitor_tick(self):
+        """Surveillance des risques"""
+        if not self.risk_manager:
+            return
+            
+        # Récupérer les métriques de risque
+        capital = self.config['trading']['initial_balance']
+        risk_metrics = self.risk_manager.get_risk_metrics(capital)
+        
+        # Vérifier les limites
+        if risk_metrics.current_drawdown > 0.15:  # 15% drawdown
+            log_warning(f"⚠️ Drawdown élevé: {risk_metrics.current_drawdown:.1%}")
+            
+            if risk_metrics.current_drawdown > 0.20:  # 20% = limite critique
+                log_error("🚨 DRAWDOWN CRITIQUE - Arrêt du trading")
+                await self._pause_trading()
                 
-                try:
-                    await asyncio.wait_for(
-                        self._shutdown_event.wait(),
-                        timeout=interval
+                if self.notifier:
+                    await self.notifier.send_message(
+                        "🚨 ALERTE CRITIQUE: Drawdown > 20% - Trading mis en pause",
+                        NotificationLevel.ALERT
                     )
-                    break
-                except asyncio.TimeoutError:
-                    pass
-                
-            except asyncio.CancelledError:
-                log_debug("Performance tracker loop annulée")
-                break
-            except Exception as e:
-                log_error(f"Erreur dans performance tracker: {str(e)}")
-                await asyncio.sleep(5)
+        
+        if risk_metrics.daily_pnl < -0.05:  # Perte quotidienne > 5%
+            log_warning(f"⚠️ Perte quotidienne élevée: {risk_metrics.daily_pnl:.1%}")
+        
+        # Mettre à jour les positions avec trailing stops
+        if self.pair_manager and self.market_data and hasattr(self.pair_manager, 'positions'):
+            for symbol, position in self.pair_manager.positions.items():
+                last_price = self.market_data.get_last_price(symbol)
+                if last_price is not None:
+                    new_stop = self.risk_manager.update_trailing_stop(position, last_price)
+                    if new_stop:
+                        position['stop_loss'] = new_stop
+                        log_debug("Trailing stop mis à jour pour %s: %.2f", symbol, new_stop)
+    
+    async def _performance_tracker_tick(self):
+        """Suivi des performances"""
+        if not self.pair_manager:
+            return
+            
+        # Calculer les performances
+        perf = {}
+        if hasattr(self.pair_manager, 'get_performance_summary'):
+            perf = self.pair_manager.get_performance_summary()
+        
+        # Mettre à jour le status
+        self.status.total_trades = perf.get('total_trades', 0)
+        self.status.total_pnl = perf.get('total_pnl', 0.0)
+        
+        # Calculer le PnL quotidien
+        daily_pnl = self._calculate_daily_pnl()
+        self.status.daily_pnl = daily_pnl
+        
+        # Logger les performances
+        if perf.get('total_trades', 0) > 0:
+            log_info(
+                f"📈 Performance - Trades: {perf['total_trades']} | "
+                f"Win Rate: {perf.get('win_rate', 0):.1f}% | "
+                f"PnL: {perf.get('total_pnl', 0):+.2f} USDT | "
+                f"Daily: {daily_pnl:+.2f} USDT"
+            )
+        
+        # Envoyer résumé quotidien si c'est l'heure
+        now = datetime.now()
+        if self.notifier and now.hour == 18 and now.minute < 5:
+            await self._send_daily_summary()
     
     async def _send_daily_summary(self):
         """Envoie le résumé quotidien via Telegram"""
@@ -742,58 +984,42 @@ class TradingBot:
         except Exception as e:
             log_error(f"Erreur envoi résumé quotidien: {str(e)}")
     
-    async def _health_check_loop(self):
-        """Boucle de vérification de santé"""
-        interval = 60
-        while not self._shutdown_event.is_set():
-            try:
-                if self.status.state != BotState.RUNNING:
-                    await asyncio.sleep(1)
-                    continue
-                # Vérifier la connexion WebSocket
-                if self.websocket_feed:
-                    ws_metrics = self.websocket_feed.get_metrics()
-                    if not ws_metrics['connected']:
-                        log_error("WebSocket déconnecté, tentative de reconnexion...")
-                        await self.websocket_feed.connect()
-                    
-                    # Vérifier la latence moyenne
-                    if ws_metrics['avg_latency_ms'] > 200:
-                        log_warning(f"Latence moyenne élevée: {ws_metrics['avg_latency_ms']:.0f}ms")
-                
-                # Vérifier l'exchange
-                if self.exchange and hasattr(self.exchange, 'connected') and not self.exchange.connected:
-                    log_error("Exchange déconnecté, tentative de reconnexion...")
-                    await self.exchange.connect(
-                        self.config['exchange']['api_key'],
-                        self.config['exchange']['api_secret']
-                    )
-                
-                # Nettoyer les erreurs anciennes
-                if len(self.status.errors) > 100:
-                    self.status.errors = self.status.errors[-50:]
-                
-                # Réinitialiser les compteurs quotidiens si nouveau jour
-                await self._check_daily_reset()
-                
-                try:
-                    await asyncio.wait_for(
-                        self._shutdown_event.wait(),
-                        timeout=interval
-                    )
-                    break
-                except asyncio.TimeoutError:
-                    pass
-                
-            except asyncio.CancelledError:
-                log_debug("Health check loop annulée")
-                break
-            except Exception as e:
-                log_error(f"Erreur dans health check: {str(e)}")
-                await asyncio.sleep(5)
+    async def _health_check_tick(self):
+        """Vérification de santé"""
+        # Vérifier la connexion WebSocket
+        if self.websocket_feed:
+            ws_metrics = self.websocket_feed.get_metrics()
+            if not ws_metrics['connected']:
+                log_error("WebSocket déconnecté, tentative de reconnexion...")
+                await self.websocket_feed.connect()
+            
+            # Vérifier la latence moyenne
+            if ws_metrics['avg_latency_ms'] > 200:
+                log_warning(f"Latence moyenne élevée: {ws_metrics['avg_latency_ms']:.0f}ms")
+        
+        # Une seule alerte agrégée pour les updates lentes depuis le dernier check
+        if self._ws_latency_over:
+            log_warning(
+                f"{self._ws_latency_over} updates avec latence > 200ms "
+                f"(max: {self._ws_latency_max:.0f}ms)"
+            )
+        self._ws_latency_over = 0
+        self._ws_latency_max = 0.0
+        
+        # Vérifier l'exchange
+        if self.exchange and hasattr(self.exchange, 'connected') and not self.exchange.connected:
+            log_error("Exchange déconnecté, tentative de reconnexion...")
+            await self.exchange.connect(
+                self.config['exchange']['api_key'],
+                self.config['exchange']['api_secret']
+            )
+        
+        # Réinitialiser les compteurs quotidiens si nouveau jour
+        await self._check_daily_reset()
     
     async def _pause_trading(self):
         """Met en pause le trading (garde la surveillance active)"""
+        self._running = False
         self.status.state = BotState.PAUSED
         log_warning("Trading mis en pause")
         
@@ -807,22 +1033,15 @@ class TradingBot:
     
     def _calculate_daily_pnl(self) -> float:
         """Calcule le PnL du jour"""
-        if not self.pair_manager or not hasattr(self.pair_manager, 'performance'):
+        if not self.pair_manager or not hasattr(self.pair_manager, 'perf_pnl'):
             return 0.0
-            
-        perf = self.pair_manager.performance
-        daily_pnl = 0.0
-        
-        for symbol, data in perf.items():
-            if data.get('last_trade') and isinstance(data['last_trade'], datetime):
-                time_since = datetime.now() - data['last_trade']
-                if time_since < timedelta(days=1):
-                    # Approximation : prendre une portion du PnL total
-                    pnl = data.get('pnl', 0)
-                    if pnl is not None:
-                        daily_pnl += pnl * 0.1
-        
-        return daily_pnl
+        
+        # Paires ayant tradé dans les dernières 24h
+        now_ns = time.time_ns()
+        recent = (now_ns - self.pair_manager.perf_last_trade_ns) < 86_400_000_000_000
+        
+        # Approximation : prendre une portion du PnL total
+        return float(np.sum(self.pair_manager.perf_pnl, where=recent)) * 0.1
     
     async def _check_daily_reset(self):
         """Vérifie et effectue le reset quotidien si nécessaire"""
@@ -836,8 +1055,17 @@ class TradingBot:
         else:
             self._last_daily_reset = now
     
-    async def _save_state(self):
-        """Sauvegarde l'état actuel du bot"""
+    async def _save_state(self, snapshot: bool = False):
+        """
+        Sauvegarde l'état actuel du bot
+        
+        L'état est publié sur Redis (clé bot:state et canal bot:state:updates)
+        si disponible. Le fichier data/bot_state.json n'est écrit que pour un
+        snapshot (arrêt du bot) ou à défaut de Redis.
+        
+        Args:
+            snapshot: Écrire aussi le fichier d'état sur disque
+        """
         try:
             if not self.pair_manager:
                 return
@@ -848,20 +1076,34 @@ class TradingBot:
                 
             state = {
                 'timestamp': datetime.now().isoformat(),
-                'state': self.status.state.value,
+                'state': self.status.state.name.lower(),
                 'total_trades': self.status.total_trades,
                 'open_positions': self.status.open_positions,
                 'total_pnl': self.status.total_pnl,
                 'daily_pnl': self.status.daily_pnl,
                 'positions': positions,
-                'errors': self.status.errors[-10:]  # Garder les 10 dernières erreurs
+                'errors': list(self.status.errors)[-10:]  # Garder les 10 dernières erreurs
             }
             
-            state_file = Path('data/bot_state.json')
-            state_file.parent.mkdir(parents=True, exist_ok=True)
+            write_file = snapshot or self._redis is None
             
-            with open(state_file, 'w') as f:
-                json.dump(state, f, indent=2)
+            if self._redis is not None:
+                try:
+                    payload = orjson.dumps(state, option=orjson.OPT_SERIALIZE_NUMPY)
+                    await self._redis.set('bot:state', payload)
+                    await self._redis.publish('bot:state:updates', payload)
+                except Exception as e:
+                    log_error(f"Erreur publication état Redis: {str(e)}")
+                    write_file = True
+            
+            if write_file:
+                state_file = Path('data/bot_state.json')
+                state_file.parent.mkdir(parents=True, exist_ok=True)
+                
+                # Sérialisation orjson et écriture hors de la boucle d'événements
+                data = orjson.dumps(state, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, state_file.write_bytes, data)
                 
             log_debug("État du bot sauvegardé")
             
@@ -872,6 +1114,7 @@ class TradingBot:
         """Arrêt propre du bot"""
         log_info("🔴 Début de l'arrêt du bot...")
         self._shutdown_event.set()
+        self._running = False
         self.status.state = BotState.STOPPING
         if self.websocket_feed:
             log_info("Fermeture des connexions WebSocket...")
@@ -882,7 +1125,14 @@ class TradingBot:
                 task.cancel()
         if self._tasks:
             await asyncio.gather(*self._tasks, return_exceptions=True)
-        await self._save_state()
+        await self._save_state(snapshot=True)
+        if self._redis is not None:
+            try:
+                await self._redis.aclose()
+            except Exception as e:
+                log_error(f"Erreur fermeture Redis: {str(e)}")
+            self._redis = None
+        self._remove_loop_signal_handlers()
         if self.notifier and self.notifier.enabled:
             await self.notifier.send_message(
                 "🔴 Bot arrêté",
@@ -891,9 +1141,18 @@ class TradingBot:
         self.status.state = BotState.STOPPED
         log_info("✅ Bot arrêté proprement")
     
+    def _monotonic_to_datetime(self, ns: int) -> datetime:
+        """Convertit un horodatage time.monotonic_ns() en datetime local"""
+        return datetime.fromtimestamp((ns + self._wall_clock_offset_ns) / 1e9)
+    
     def get_status(self) -> Dict:
         """Retourne l'état actuel du bot"""
         uptime = datetime.now() - self.status.start_time
+        self.status.last_update = self._monotonic_to_datetime(self._last_update_ns)
+        
+        # Reporter les compteurs WebSocket
+        self.status.metrics['ws_updates'] = self._ws_update_count
+        self.status.metrics['ws_latency_max_ms'] = self._ws_latency_max
         
         # Métriques WebSocket
         ws_metrics = {}
@@ -910,7 +1169,7 @@ class TradingBot:
             pairs_count = len(self.pair_manager.strategies)
         
         return {
-            'state': self.status.state.value,
+            'state': self.status.state.name.lower(),
             'uptime': str(uptime),
             'start_time': self.status.start_time.isoformat(),
             'last_update': self.status.last_update.isoformat(),
@@ -923,7 +1182,7 @@ class TradingBot:
                 'performance': perf
             },
             'websocket': ws_metrics,
-            'errors': self.status.errors[-10:] if self.status.errors else [],
+            'errors': list(self.status.errors)[-10:],
             'config': {
                 'exchange': self.config['exchange']['name'],
                 'pairs': pairs_count,
@@ -86,6 +86,7 @@ class WebSocketMarketFeed:
         self.subscription_count = 0
         self.subscription_reset_time = time.time()
         self.pending_subscriptions = []
+        self.max_streams_per_message = 200
         
         # Subscriptions
         self.subscriptions: Dict[str, Set[DataType]] = defaultdict(set)
@@ -295,19 +296,15 @@ class WebSocketMarketFeed:
         """Re-souscrit à tous les streams après reconnexion"""
         log_info(f"Re-souscription à {len(self.subscriptions)} paires")
         
-        # Réinitialiser la file d'attente
+        # Les souscriptions en attente sont couvertes par le renvoi groupé
         self.pending_subscriptions = []
         
-        # Ajouter toutes les souscriptions à la file
-        for symbol, data_types in self.subscriptions.items():
-            for data_type in data_types:
-                self.pending_subscriptions.append((symbol, data_type))
-        
-        # Démarrer le traitement des souscriptions
-        if self.pending_subscriptions:
-            self._subscription_task = asyncio.create_task(self._process_subscriptions())
-        
-        log_info("Re-souscription en cours...")
+        streams = [
+            self._stream_name(symbol, data_type)
+            for symbol, data_types in self.subscriptions.items()
+            for data_type in data_types
+        ]
+        await self._send_subscribe(streams)
 
     async def _process_subscriptions(self):
         """Traite les souscriptions en attente avec gestion des limites"""
@@ -323,7 +320,7 @@ class WebSocketMarketFeed:
             if self.subscription_count >= self.max_subscriptions_per_second:
                 wait_time = 1.0 - (current_time - self.subscription_reset_time)
                 if wait_time > 0:
-                    log_debug(f"Limite de taux atteinte, attente de {wait_time:.2f}s")
+                    log_debug("Limite de taux atteinte, attente de %.2fs", wait_time)
                     await asyncio.sleep(wait_time)
                 self.subscription_count = 0
                 self.subscription_reset_time = time.time()
@@ -336,38 +333,66 @@ class WebSocketMarketFeed:
             # Attendre le délai minimum entre les souscriptions
             await asyncio.sleep(self.subscription_delay)
 
-    async def _subscribe_to_stream(self, symbol: str, data_type: DataType):
-        """Souscrit à un stream spécifique"""
-        if not self.websocket:
-            return
+    @staticmethod
+    def _stream_name(symbol: str, data_type: DataType) -> str:
+        """
+        Construit le nom du stream Binance pour un symbole
         
-        # Construire le nom du stream
+        Args:
+            symbol: Symbole (ex: BTC/USDT ou btcusdt)
+            data_type: Type de données
+            
+        Returns:
+            Nom du stream (ex: btcusdt@ticker)
+        """
         symbol_lower = symbol.replace('/', '').lower()
         
-        stream_name = ""
         if data_type == DataType.TICKER:
-            stream_name = f"{symbol_lower}@ticker"
+            return f"{symbol_lower}@ticker"
         elif data_type == DataType.TRADES:
-            stream_name = f"{symbol_lower}@trade"
+            return f"{symbol_lower}@trade"
         elif data_type == DataType.ORDERBOOK:
-            stream_name = f"{symbol_lower}@depth@100ms"
+            return f"{symbol_lower}@depth@100ms"
         elif data_type == DataType.KLINES:
-            stream_name = f"{symbol_lower}@kline_1m"
+            return f"{symbol_lower}@kline_1m"
         elif data_type == DataType.DEPTH:
-            stream_name = f"{symbol_lower}@depth"
+            return f"{symbol_lower}@depth"
+        return ""
+    
+    async def _send_subscribe(self, streams: List[str]):
+        """
+        Envoie une commande SUBSCRIBE groupée pour plusieurs streams
         
-        # Envoyer la commande de souscription
-        subscribe_message = {
-            "method": "SUBSCRIBE",
-            "params": [stream_name],
-            "id": int(time.time() * 1000)
-        }
+        Les streams sont envoyés par lots de max_streams_per_message, en
+        respectant la limite de messages par seconde.
         
-        try:
-            await self.websocket.send(json.dumps(subscribe_message))
-            log_debug(f"Souscrit au stream: {stream_name}")
-        except Exception as e:
-            log_error(f"Erreur lors de la souscription à {stream_name}: {e}")
+        Args:
+            streams: Noms des streams à souscrire
+        """
+        if not self.websocket or not streams:
+            return
+        
+        step = self.max_streams_per_message
+        for start in range(0, len(streams), step):
+            if start:
+                await asyncio.sleep(1.0 / self.max_subscriptions_per_second)
+            
+            params = streams[start:start + step]
+            subscribe_message = {
+                "method": "SUBSCRIBE",
+                "params": params,
+                "id": int(time.time() * 1000)
+            }
+            
+            try:
+                await self.websocket.send(json.dumps(subscribe_message))
+                log_debug("Souscrit à %d streams", len(params))
+            except Exception as e:
+                log_error(f"Erreur lors de la souscription à {len(params)} streams: {e}")
+    
+    async def _subscribe_to_stream(self, symbol: str, data_type: DataType):
+        """Souscrit à un stream spécifique"""
+        await self._send_subscribe([self._stream_name(symbol, data_type)])
 
     async def _process_message(self, data: Dict, receive_time: float):
         """
@@ -611,4 +636,30 @@ class WebSocketMarketFeed:
         if callback:
             self.callbacks[symbol_normalized].append(callback)
         
-        log_info(f"Souscription ajoutée: {symbol} - {[dt.value for dt in data_types]}")
\ No newline at end of file
+        log_info(f"Souscription ajoutée: {symbol} - {[dt.value for dt in data_types]}")
+
+    async def subscribe_many(self, symbols: List[str], data_types: List[DataType],
+                             callback: Optional[Callable] = None):
+        """
+        S'abonne aux données de plusieurs symboles en une seule commande
+        
+        Args:
+            symbols: Symboles (ex: ['BTC/USDT', 'ETH/USDT'])
+            data_types: Types de données à recevoir pour chaque symbole
+            callback: Fonction appelée lors des mises à jour
+        """
+        streams = []
+        for symbol in symbols:
+            symbol_normalized = symbol.replace('/', '').lower()
+            for data_type in data_types:
+                if data_type not in self.subscriptions[symbol_normalized]:
+                    self.subscriptions[symbol_normalized].add(data_type)
+                    streams.append(self._stream_name(symbol_normalized, data_type))
+            if callback:
+                self.callbacks[symbol_normalized].append(callback)
+        
+        # Si déjà connecté, envoyer immédiatement (sinon connect() re-souscrit)
+        if self.connected and self.websocket:
+            await self._send_subscribe(streams)
+        
+        log_info(f"Souscriptions ajoutées: {len(symbols)} paires - {[dt.value for dt in data_types]}")
\ No newline at end of file
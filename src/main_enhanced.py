@@ -11,7 +11,7 @@ from dotenv import load_dotenv
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.core.trading_bot import TradingBot
+from src.core.trading_bot import TradingBot, install_event_loop_policy
 from src.core.logger import log_info, log_error
 
 # Variable globale pour le bot
@@ -112,6 +112,7 @@ async def main():
         print("✅ Arrêt propre terminé.")
 
 if __name__ == "__main__":
+    install_event_loop_policy()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -367,7 +367,7 @@ class AIEnhancedStrategy(Strategy):
         if self.current_regime is None:
             self.current_regime = self._identify_market_regime(df)
         regime_type = self.current_regime.type
-        log_debug(f"Régime: {regime_type} (force: {self.current_regime.strength:.2f})")
+        log_debug("Régime: %s (force: %.2f)", regime_type, self.current_regime.strength)
         
         # 2. Extraire les features
         features = self._extract_features(df)
@@ -363,7 +363,7 @@ class ScalpingStrategy:
             
             # Mesurer la latence
             latency = (time.time() - start_time) * 1000
-            log_debug(f"Signal généré en {latency:.2f}ms - Type: {best_signal.signal_type.value}")
+            log_debug("Signal généré en %.2fms - Type: %s", latency, best_signal.signal_type.value)
             
             return best_signal
         
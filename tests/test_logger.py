@@ -0,0 +1,70 @@
+"""
+Tests unitaires pour le module de logging
+"""
+
+import logging
+import unittest
+from unittest.mock import patch
+
+from src.core.logger import logger, log_debug, set_log_level, is_debug_enabled
+
+
+class CountingArg:
+    """Argument de log qui compte ses conversions en chaîne"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __str__(self):
+        self.calls += 1
+        return "arg"
+
+
+class TestLogDebug(unittest.TestCase):
+    """Tests pour le formatage paresseux de log_debug"""
+
+    def setUp(self):
+        """Configuration avant chaque test"""
+        self.previous_level = logger.level
+
+    def tearDown(self):
+        """Restaure le niveau du logger après chaque test"""
+        logger.setLevel(self.previous_level)
+
+    def test_no_formatting_when_debug_disabled(self):
+        """Test qu'aucun formatage n'a lieu quand DEBUG est désactivé"""
+        set_log_level('INFO')
+        arg = CountingArg()
+
+        with patch.object(logger, 'debug') as debug:
+            log_debug("Valeur %s", arg)
+
+        debug.assert_not_called()
+        self.assertEqual(arg.calls, 0)
+        self.assertFalse(is_debug_enabled())
+
+    def test_percent_formatting_when_debug_enabled(self):
+        """Test que les arguments sont formatés à la %-style quand DEBUG est actif"""
+        set_log_level('DEBUG')
+
+        with self.assertLogs(logger, level='DEBUG') as logs:
+            log_debug("Stop %s: %.2f", 'BTC/USDT', 1.5)
+
+        self.assertEqual(logs.records[0].getMessage(), "Stop BTC/USDT: 1.50")
+        self.assertTrue(is_debug_enabled())
+
+    def test_direct_set_level_is_honoured(self):
+        """Test qu'un appel direct à logger.setLevel est pris en compte"""
+        set_log_level('DEBUG')
+        logger.setLevel(logging.WARNING)
+        arg = CountingArg()
+
+        with patch.object(logger, 'debug') as debug:
+            log_debug("Valeur %s", arg)
+
+        debug.assert_not_called()
+        self.assertFalse(is_debug_enabled())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+Tests unitaires pour le gestionnaire de données de marché
+"""
+
+import unittest
+from unittest.mock import Mock
+import numpy as np
+
+from src.core.market_data import MarketData
+
+
+class TestTickerColumns(unittest.TestCase):
+    """Tests pour les tickers temps réel stockés en colonnes numpy"""
+
+    def setUp(self):
+        """Configuration avant chaque test"""
+        self.market_data = MarketData(exchange_connector=Mock(), config={'max_symbols': 2})
+
+    def test_update_and_read_last_price(self):
+        """Test la mise à jour d'un ticker puis la lecture du dernier prix"""
+        self.market_data.update_ticker('btcusdt', {'last': 50000.0, 'bid': 49999.0, 'ask': 50001.0}, 1.0)
+
+        # Le symbole est accessible sous ses deux formats
+        self.assertEqual(self.market_data.get_last_price('BTC/USDT'), 50000.0)
+        self.assertEqual(self.market_data.get_last_price('btcusdt'), 50000.0)
+
+        i = self.market_data.symbol_index('BTC/USDT')
+        self.assertEqual(self.market_data.bid[i], 49999.0)
+        self.assertEqual(self.market_data.ask[i], 50001.0)
+        self.assertEqual(self.market_data.ts[i], 1.0)
+
+    def test_raw_and_slashed_symbols_share_slot(self):
+        """Test que les deux formats de symbole écrivent dans la même colonne"""
+        self.market_data.update_ticker('BTC/USDT', {'last': 1.0, 'bid': 1.0, 'ask': 1.0}, 0.0)
+        self.market_data.update_ticker('btcusdt', {'last': 2.0, 'bid': 2.0, 'ask': 2.0}, 0.0)
+
+        self.assertEqual(len(self.market_data._sym_idx), 1)
+        self.assertEqual(self.market_data.get_last_price('BTC/USDT'), 2.0)
+
+    def test_unknown_symbol(self):
+        """Test qu'un symbole sans ticker ne retourne pas de prix"""
+        self.assertIsNone(self.market_data.get_last_price('ETH/USDT'))
+
+        # Un symbole indexé mais jamais mis à jour n'a pas de prix non plus
+        self.market_data.symbol_index('ETH/USDT')
+        self.assertIsNone(self.market_data.get_last_price('ETH/USDT'))
+
+    def test_columns_grow_with_symbols(self):
+        """Test l'agrandissement des colonnes au-delà de la capacité initiale"""
+        for i, symbol in enumerate(['btcusdt', 'ethusdt', 'bnbusdt']):
+            self.market_data.update_ticker(symbol, {'last': float(i), 'bid': 0.0, 'ask': 0.0}, 0.0)
+
+        self.assertEqual(len(self.market_data.last), 4)
+        self.assertEqual(self.market_data.get_last_price('BTC/USDT'), 0.0)
+        self.assertEqual(self.market_data.get_last_price('BNB/USDT'), 2.0)
+        self.assertTrue(np.isnan(self.market_data.last[3]))
+
+
+if __name__ == '__main__':
+    unittest.main()
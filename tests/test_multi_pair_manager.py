@@ -0,0 +1,46 @@
+"""
+Tests unitaires pour le gestionnaire multi-paires
+"""
+
+import unittest
+from unittest.mock import Mock
+import numpy as np
+
+from src.core.multi_pair_manager import MultiPairManager
+
+
+class TestPerformanceColumns(unittest.TestCase):
+    """Tests pour le suivi du PnL par paire en colonnes numpy"""
+
+    def setUp(self):
+        """Configuration avant chaque test"""
+        self.manager = MultiPairManager(Mock(), {})
+
+    def test_record_and_overwrite(self):
+        """Test que le PnL cumulé d'une paire est réécrit dans sa colonne"""
+        self.manager._record_trade_performance('BTC/USDT', 10.0)
+        self.manager._record_trade_performance('BTC/USDT', 25.0)
+
+        i = self.manager._perf_idx['BTC/USDT']
+        self.assertEqual(len(self.manager._perf_idx), 1)
+        self.assertEqual(self.manager.perf_pnl[i], 25.0)
+        self.assertGreater(self.manager.perf_last_trade_ns[i], 0)
+
+    def test_columns_grow_past_initial_capacity(self):
+        """Test l'agrandissement des colonnes au-delà des 16 emplacements initiaux"""
+        for k in range(17):
+            self.manager._record_trade_performance(f'PAIR{k}/USDT', float(k))
+
+        self.assertEqual(len(self.manager.perf_pnl), 32)
+        self.assertEqual(len(self.manager.perf_last_trade_ns), 32)
+        self.assertEqual(self.manager.perf_last_trade_ns.dtype, np.int64)
+
+        # Les valeurs existantes sont conservées après l'agrandissement
+        for k in range(17):
+            i = self.manager._perf_idx[f'PAIR{k}/USDT']
+            self.assertEqual(self.manager.perf_pnl[i], float(k))
+        self.assertEqual(self.manager.perf_pnl.sum(), float(sum(range(17))))
+
+
+if __name__ == '__main__':
+    unittest.main()
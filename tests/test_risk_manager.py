@@ -0,0 +1,40 @@
+"""
+Tests unitaires pour le gestionnaire de risque
+"""
+
+import unittest
+
+from src.core.risk_manager import RiskManager
+
+
+class TestTrailingStops(unittest.TestCase):
+    """Tests pour la mise à jour des trailing stops"""
+
+    def setUp(self):
+        """Configuration avant chaque test"""
+        self.risk_manager = RiskManager({'use_trailing_stop': True, 'trailing_stop_distance': 0.02})
+
+    def test_long_stop_only_moves_up(self):
+        """Test que le stop d'une position LONG suit la hausse sans jamais baisser"""
+        position = {'side': 'LONG', 'stop_loss': 49000.0}
+
+        self.assertAlmostEqual(self.risk_manager.update_trailing_stop(position, 51000.0), 51000.0 * 0.98)
+        self.assertIsNone(self.risk_manager.update_trailing_stop(position, 49500.0))
+
+    def test_short_stop_only_moves_down(self):
+        """Test que le stop d'une position SHORT suit la baisse sans jamais monter"""
+        position = {'side': 'SHORT', 'stop_loss': 110.0}
+
+        self.assertAlmostEqual(self.risk_manager.update_trailing_stop(position, 100.0), 100.0 * 1.02)
+        self.assertIsNone(self.risk_manager.update_trailing_stop(position, 108.0))
+
+    def test_disabled_trailing_stop(self):
+        """Test qu'aucun stop n'est modifié si le trailing stop est désactivé"""
+        self.risk_manager.use_trailing_stop = False
+        position = {'side': 'LONG', 'stop_loss': 49000.0}
+
+        self.assertIsNone(self.risk_manager.update_trailing_stop(position, 60000.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,319 @@
+"""
+Tests unitaires pour les tâches périodiques du TradingBot
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+from src.core.market_data import MarketData
+from src.core.multi_pair_manager import MultiPairManager
+from src.core.trading_bot import TradingBot
+from src.core.websocket_market_feed import MarketUpdate, DataType
+
+DAY_NS = 86_400_000_000_000
+
+
+def make_bot(config=None):
+    """Crée un bot sans charger le fichier de configuration"""
+    with patch.object(TradingBot, '_load_and_validate_config', return_value=config or {}):
+        return TradingBot()
+
+
+class TestDailyPnl(unittest.TestCase):
+    """Tests pour le calcul du PnL quotidien"""
+
+    def setUp(self):
+        """Configuration avant chaque test"""
+        self.bot = make_bot()
+        self.bot.pair_manager = MultiPairManager(Mock(), {})
+
+    def test_no_pair_manager(self):
+        """Test qu'aucun PnL n'est calculé sans gestionnaire de paires"""
+        self.bot.pair_manager = None
+        self.assertEqual(self.bot._calculate_daily_pnl(), 0.0)
+
+    def test_only_recent_pairs_counted(self):
+        """Test que seules les paires ayant tradé dans les dernières 24h comptent"""
+        pm = self.bot.pair_manager
+        pm._record_trade_performance('BTC/USDT', 100.0)
+        pm._record_trade_performance('ETH/USDT', 50.0)
+        pm._record_trade_performance('SOL/USDT', -20.0)
+
+        # Dernier trade ETH il y a plus de 24h
+        pm.perf_last_trade_ns[pm._perf_idx['ETH/USDT']] = time.time_ns() - DAY_NS - 1
+
+        # (100 - 20) * 0.1
+        self.assertAlmostEqual(self.bot._calculate_daily_pnl(), 8.0)
+
+    def test_after_column_growth(self):
+        """Test le calcul après agrandissement des colonnes de performance"""
+        pm = self.bot.pair_manager
+        for k in range(20):
+            pm._record_trade_performance(f'PAIR{k}/USDT', 1.0)
+
+        self.assertAlmostEqual(self.bot._calculate_daily_pnl(), 2.0)
+
+
+class TestMainLoop(unittest.IsolatedAsyncioTestCase):
+    """Tests pour la sélection et l'exécution des boucles de fond"""
+
+    async def test_updates_consumer_always_enabled(self):
+        """Test que le consommateur WebSocket reste actif et s'arrête sur un flux calme"""
+        bot = make_bot({'loops': {
+            'scanner': False, 'strategy': False, 'risk_monitor': False,
+            'performance': False, 'health_check': False, 'optimizer': False,
+            'updates': False
+        }})
+        self.assertEqual([name for name, _ in bot._get_enabled_loops()], ['Updates'])
+
+        task = asyncio.create_task(bot._main_loop())
+        await asyncio.sleep(0.05)
+        bot._shutdown_event.set()
+        await asyncio.wait_for(task, timeout=3)
+
+
+class TestScheduler(unittest.IsolatedAsyncioTestCase):
+    """Tests pour l'ordonnanceur des tâches périodiques"""
+
+    def setUp(self):
+        """Configuration avant chaque test"""
+        self.bot = make_bot()
+        self.bot._running = True
+        self.calls = []
+
+    def job(self, name, result=None, duration=0.0, error=False):
+        """Crée une fonction d'itération qui enregistre ses appels"""
+        async def tick():
+            self.calls.append(name)
+            if duration:
+                await asyncio.sleep(duration)
+            if error:
+                raise RuntimeError(name)
+            return result() if callable(result) else result
+        return tick
+
+    async def run_scheduler(self, jobs, seconds):
+        """Exécute l'ordonnanceur pendant une durée donnée puis demande l'arrêt"""
+        self.bot._get_periodic_jobs = lambda: jobs
+        task = asyncio.create_task(self.bot._scheduler_loop())
+        await asyncio.sleep(seconds)
+        self.bot._shutdown_event.set()
+        await asyncio.wait_for(task, timeout=2)
+
+    async def test_deadline_ordering(self):
+        """Test que les tâches sont lancées dans l'ordre de leurs échéances"""
+        await self.run_scheduler([
+            ('Slow', 10, self.job('Slow')),
+            ('Fast', 0.05, self.job('Fast')),
+        ], 0.18)
+
+        # Même échéance initiale : l'intervalle le plus court passe en premier
+        self.assertEqual(self.calls[:2], ['Fast', 'Slow'])
+        self.assertEqual(self.calls.count('Slow'), 1)
+        self.assertGreaterEqual(self.calls.count('Fast'), 3)
+
+    async def test_slow_tick_does_not_delay_others(self):
+        """Test qu'une itération lente ne retarde pas les autres tâches"""
+        await self.run_scheduler([
+            ('Blocking', 10, self.job('Blocking', duration=1.0)),
+            ('Risk', 0.05, self.job('Risk')),
+        ], 0.3)
+
+        self.assertGreaterEqual(self.calls.count('Risk'), 4)
+
+    async def test_same_job_never_overlaps(self):
+        """Test qu'une tâche n'est pas relancée tant que son itération tourne"""
+        active = []
+        max_active = []
+
+        async def tick():
+            active.append(1)
+            max_active.append(len(active))
+            await asyncio.sleep(0.1)
+            active.pop()
+
+        await self.run_scheduler([('Long', 0.01, tick)], 0.35)
+
+        self.assertEqual(max(max_active), 1)
+        self.assertGreaterEqual(len(max_active), 2)
+
+    async def test_retry_after(self):
+        """Test que le délai de reprise retourné par une itération est respecté"""
+        results = iter([0.05])
+        await self.run_scheduler([
+            ('Retry', 10, self.job('Retry', result=lambda: next(results, None))),
+        ], 0.2)
+
+        # Reprise après 0.05s, puis intervalle normal de 10s
+        self.assertEqual(self.calls.count('Retry'), 2)
+
+    async def test_retry_after_exception(self):
+        """Test la reprise après le délai d'erreur quand une itération échoue"""
+        self.assertEqual(self.bot._scheduler_retry_delay, 5)
+        self.bot._scheduler_retry_delay = 0.05
+
+        await self.run_scheduler([('Fail', 10, self.job('Fail', error=True))], 0.2)
+
+        self.assertGreaterEqual(self.calls.count('Fail'), 2)
+
+    async def test_exit_on_shutdown(self):
+        """Test l'arrêt de l'ordonnanceur et l'annulation des itérations en cours"""
+        cancelled = []
+
+        async def tick():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        self.bot._get_periodic_jobs = lambda: [('Long', 10, tick)]
+        task = asyncio.create_task(self.bot._scheduler_loop())
+        await asyncio.sleep(0.05)
+
+        self.bot._shutdown_event.set()
+        await asyncio.wait_for(task, timeout=1)
+
+        self.assertEqual(cancelled, [True])
+
+
+class TestGetStatus(unittest.TestCase):
+    """Tests pour le status retourné par get_status"""
+
+    def setUp(self):
+        """Configuration avant chaque test"""
+        self.bot = make_bot({
+            'exchange': {'name': 'binance'},
+            'strategy': {'name': 'multi_signal'}
+        })
+
+    def test_returned_status_is_independent(self):
+        """Test qu'un status retourné n'est pas modifié par les appels suivants"""
+        first = self.bot.get_status()
+        self.bot.status.total_trades = 3
+
+        second = self.bot.get_status()
+
+        self.assertEqual(first['trading']['total_trades'], 0)
+        self.assertEqual(second['trading']['total_trades'], 3)
+
+    def test_caller_changes_do_not_leak(self):
+        """Test que modifier un status retourné n'affecte pas les suivants"""
+        status = self.bot.get_status()
+        status['trading']['total_pnl'] = 999.0
+        status['config']['exchange'] = 'other'
+
+        status = self.bot.get_status()
+
+        self.assertEqual(status['trading']['total_pnl'], 0.0)
+        self.assertEqual(status['config']['exchange'], 'binance')
+
+
+class TestHandleMarketUpdate(unittest.TestCase):
+    """Tests pour la mise en file des mises à jour WebSocket"""
+
+    def test_full_queue_drops_oldest(self):
+        """Test que la plus ancienne mise à jour est abandonnée quand la file est pleine"""
+        bot = make_bot()
+        bot._update_queue = asyncio.Queue(maxsize=2)
+        updates = [MarketUpdate(f'pair{k}usdt', DataType.TICKER, {}, float(k), 0.0) for k in range(3)]
+
+        for update in updates:
+            bot._handle_market_update(update)
+
+        self.assertEqual(bot._update_queue.qsize(), 2)
+        self.assertIs(bot._update_queue.get_nowait(), updates[1])
+        self.assertIs(bot._update_queue.get_nowait(), updates[2])
+
+
+class TestApplyBatch(unittest.TestCase):
+    """Tests pour l'application des mises à jour WebSocket par lots"""
+
+    def test_batch_updates_tickers_and_metrics(self):
+        """Test la mise à jour des tickers et des métriques"""
+        bot = make_bot()
+        bot.market_data = MarketData(exchange_connector=Mock(), config={})
+        bot._bind_hot_paths()
+
+        data = {'last': 100.0, 'bid': 99.0, 'ask': 101.0}
+        bot._apply_batch([
+            MarketUpdate('btcusdt', DataType.TICKER, data, 1.0, 50.0),
+            MarketUpdate('ethusdt', DataType.ORDERBOOK, {}, 1.0, 300.0),
+        ])
+
+        self.assertEqual(bot.market_data.get_last_price('BTC/USDT'), 100.0)
+        self.assertIsNone(bot.market_data.get_last_price('ETH/USDT'))
+        self.assertEqual(bot._ws_update_count, 2)
+        self.assertEqual(bot._ws_latency_max, 300.0)
+        self.assertEqual(bot._ws_latency_over, 1)
+
+
+class TestRedisState(unittest.IsolatedAsyncioTestCase):
+    """Tests pour la publication de l'état sur Redis"""
+
+    def setUp(self):
+        """Configuration avant chaque test"""
+        # Travailler dans un répertoire temporaire (data/bot_state.json)
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        self.state_file = Path('data/bot_state.json')
+
+        self.bot = make_bot({'redis_url': 'redis://localhost:6379/0'})
+        self.bot.pair_manager = Mock()
+        self.bot.pair_manager.get_positions.return_value = {}
+        self.redis = AsyncMock()
+
+    def tearDown(self):
+        """Nettoyage après chaque test"""
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    async def test_connect_closes_client_on_failed_ping(self):
+        """Test que le client est fermé si Redis ne répond pas"""
+        self.redis.ping.side_effect = ConnectionError("refused")
+        with patch('src.core.trading_bot.aioredis') as aioredis:
+            aioredis.from_url.return_value = self.redis
+            await self.bot._connect_redis()
+
+        self.assertIsNone(self.bot._redis)
+        self.redis.aclose.assert_awaited_once()
+
+    async def test_save_publishes_without_file(self):
+        """Test que l'état est publié sur Redis sans écrire le fichier"""
+        self.bot._redis = self.redis
+
+        await self.bot._save_state()
+
+        self.redis.set.assert_awaited_once()
+        self.assertEqual(self.redis.set.await_args.args[0], 'bot:state')
+        self.redis.publish.assert_awaited_once()
+        self.assertEqual(self.redis.publish.await_args.args[0], 'bot:state:updates')
+        self.assertFalse(self.state_file.exists())
+
+    async def test_snapshot_also_writes_file(self):
+        """Test que le snapshot d'arrêt écrit aussi le fichier d'état"""
+        self.bot._redis = self.redis
+
+        await self.bot._save_state(snapshot=True)
+
+        self.redis.publish.assert_awaited_once()
+        self.assertTrue(self.state_file.exists())
+
+    async def test_publish_error_falls_back_to_file(self):
+        """Test le repli sur le fichier si la publication Redis échoue"""
+        self.redis.publish.side_effect = ConnectionError("lost")
+        self.bot._redis = self.redis
+
+        await self.bot._save_state()
+
+        self.assertTrue(self.state_file.exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
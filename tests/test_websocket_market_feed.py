@@ -0,0 +1,52 @@
+"""
+Tests unitaires pour le flux WebSocket de données de marché
+"""
+
+import json
+import unittest
+from unittest.mock import AsyncMock
+
+from src.core.websocket_market_feed import WebSocketMarketFeed, DataType
+
+
+class TestSubscribeMany(unittest.IsolatedAsyncioTestCase):
+    """Tests pour les souscriptions groupées"""
+
+    def setUp(self):
+        """Configuration avant chaque test"""
+        self.feed = WebSocketMarketFeed()
+        self.feed.websocket = AsyncMock()
+        self.feed.connected = True
+
+    async def test_single_subscribe_frame(self):
+        """Test qu'une seule commande SUBSCRIBE est envoyée pour toutes les paires"""
+        await self.feed.subscribe_many(['BTC/USDT', 'ETH/USDT'], [DataType.TICKER, DataType.TRADES])
+
+        self.feed.websocket.send.assert_awaited_once()
+        message = json.loads(self.feed.websocket.send.await_args.args[0])
+        self.assertEqual(message['method'], 'SUBSCRIBE')
+        self.assertEqual(
+            sorted(message['params']),
+            ['btcusdt@ticker', 'btcusdt@trade', 'ethusdt@ticker', 'ethusdt@trade']
+        )
+        self.assertEqual(self.feed.subscriptions['btcusdt'], {DataType.TICKER, DataType.TRADES})
+
+    async def test_frames_are_chunked(self):
+        """Test le découpage en plusieurs commandes au-delà de la taille maximale"""
+        self.feed.max_streams_per_message = 2
+        self.feed.max_subscriptions_per_second = 1000
+
+        await self.feed.subscribe_many(['BTC/USDT', 'ETH/USDT', 'BNB/USDT'], [DataType.TICKER])
+
+        self.assertEqual(self.feed.websocket.send.await_count, 2)
+
+    async def test_existing_subscriptions_not_resent(self):
+        """Test que les streams déjà souscrits ne sont pas renvoyés"""
+        await self.feed.subscribe_many(['BTC/USDT'], [DataType.TICKER])
+        await self.feed.subscribe_many(['BTC/USDT'], [DataType.TICKER])
+
+        self.feed.websocket.send.assert_awaited_once()
+
+
+if __name__ == '__main__':
+    unittest.main()